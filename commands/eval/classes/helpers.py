@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set
 
 from shared.compare import Comparison
 from shared.vcf.vcf import ScoredVCF
@@ -57,6 +57,8 @@ class PathObj:
         run_id: str,
         id_placeholder: str,
         base_dir: Path,
+        real_path_str: Optional[str] = None,
+        exists_confirmed: bool = False,
     ):
         self.real_name = path.name
         self.real_path = path
@@ -70,8 +72,15 @@ class PathObj:
 
         self.is_gzipped = path.suffix == ".gz"
 
+        # String forms are used repeatedly in pattern matching, so compute them once
+        self.real_path_str = real_path_str if real_path_str is not None else str(path)
+        self.relative_path_str = str(self.relative_path)
+
+        # Set when the path comes from a directory listing, saving a stat call
+        self.exists_confirmed = exists_confirmed
+
     def exists(self) -> bool:
-        return self.real_path.exists()
+        return self.exists_confirmed or self.real_path.exists()
 
     def __str__(self) -> str:
-        return str(self.relative_path)
+        return self.relative_path_str
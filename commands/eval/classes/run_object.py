@@ -1,9 +1,77 @@
-import re
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from logging import Logger
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from commands.eval.classes.helpers import PathObj
+from shared.constants import RUN_ID_PLACEHOLDER
+
+
+def get_scan_threads(logger: Logger) -> int:
+    """
+    Total number of threads used to list the result folders, split between
+    the two runs. Folders are listed sequentially unless PIPEEVAL_SCAN_THREADS
+    is set. Concurrent listing pays off on network file systems.
+    """
+    threads_str = os.environ.get("PIPEEVAL_SCAN_THREADS")
+    if not threads_str:
+        return 1
+    try:
+        threads = int(threads_str)
+    except ValueError:
+        threads = 0
+    if threads < 1:
+        logger.warning(
+            f'PIPEEVAL_SCAN_THREADS should be a positive integer, found: "{threads_str}". Listing folders sequentially.'
+        )
+        return 1
+    return threads
+
+
+def list_dir(dir: str) -> Tuple[List[str], List[str]]:
+    """
+    List files and sub folders in dir.
+    The DirEntry objects carry the file type from the directory listing,
+    so no additional stat calls are needed for regular files and folders.
+    As with Path.rglob, symlinked folders are not descended into.
+    """
+    files: List[str] = []
+    sub_dirs: List[str] = []
+    try:
+        with os.scandir(dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    sub_dirs.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry.path)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        pass
+    return (files, sub_dirs)
+
+
+def scandir_files(dir: str, threads: int = 1) -> List[str]:
+    """Recursively list paths to all files below dir"""
+    files: List[str] = []
+
+    if threads <= 1:
+        dirs_to_list = [dir]
+        while dirs_to_list:
+            (dir_files, sub_dirs) = list_dir(dirs_to_list.pop())
+            files.extend(dir_files)
+            dirs_to_list.extend(sub_dirs)
+        return files
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        pending = {executor.submit(list_dir, dir)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                (dir_files, sub_dirs) = future.result()
+                files.extend(dir_files)
+                for sub_dir in sub_dirs:
+                    pending.add(executor.submit(list_dir, sub_dir))
+    return files
 
 
 def get_files_in_dir(
@@ -11,19 +79,36 @@ def get_files_in_dir(
     run_id: str,
     run_id_placeholder: str,
     base_dir: Path,
+    threads: int = 1,
 ) -> List[PathObj]:
     processed_files_in_dir = [
-        PathObj(path, run_id, run_id_placeholder, base_dir)
-        for path in dir.rglob("*")
-        if path.is_file()
+        PathObj(
+            Path(path),
+            run_id,
+            run_id_placeholder,
+            base_dir,
+            real_path_str=path,
+            exists_confirmed=True,
+        )
+        for path in scandir_files(str(dir), threads)
     ]
     return processed_files_in_dir
 
 
+def has_datestamp_prefix(name: str) -> bool:
+    """Does name start with a datestamp such as '241111-1033_'?"""
+    return (
+        len(name) >= 12
+        and name[0:6].isdecimal()
+        and name[6] == "-"
+        and name[7:11].isdecimal()
+        and name[11] == "_"
+    )
+
+
 def detect_run_id(logger: Logger, base_dir_name: str, verbose: bool) -> str:
-    datestamp_start_match = re.match(r"\d{6}-\d{4}_(.*)", base_dir_name)
-    if datestamp_start_match:
-        non_date_part = datestamp_start_match.group(1)
+    if has_datestamp_prefix(base_dir_name):
+        non_date_part = base_dir_name[12:]
         if verbose:
             logger.info(
                 "Datestamp detected, run ID assigned as remainder of base folder name"
@@ -44,6 +129,7 @@ class RunObject:
         run_id2: str,
         results1_dir: Path,
         results2_dir: Path,
+        scan_threads: int = 1,
     ):
         self.r1_results: Path = results1_dir
         self.r2_results: Path = results2_dir
@@ -52,6 +138,50 @@ class RunObject:
         self.r2_id: str = run_id2
         self.run_ids: Tuple[str, str] = (run_id1, run_id2)
 
+        if scan_threads <= 1:
+            self.r1_paths: List[PathObj] = get_files_in_dir(
+                results1_dir, run_id1, RUN_ID_PLACEHOLDER, results1_dir
+            )
+            self.r2_paths: List[PathObj] = get_files_in_dir(
+                results2_dir, run_id2, RUN_ID_PLACEHOLDER, results2_dir
+            )
+        else:
+            # The two result folders are listed concurrently, splitting the threads
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                r1_future = executor.submit(
+                    get_files_in_dir,
+                    results1_dir,
+                    run_id1,
+                    RUN_ID_PLACEHOLDER,
+                    results1_dir,
+                    (scan_threads + 1) // 2,
+                )
+                r2_future = executor.submit(
+                    get_files_in_dir,
+                    results2_dir,
+                    run_id2,
+                    RUN_ID_PLACEHOLDER,
+                    results2_dir,
+                    scan_threads // 2,
+                )
+                self.r1_paths = r1_future.result()
+                self.r2_paths = r2_future.result()
+
+        # Indexes reused across comparisons
+        self.r1_relative_paths: Set[Path] = {p.relative_path for p in self.r1_paths}
+        self.r2_relative_paths: Set[Path] = {p.relative_path for p in self.r2_paths}
+        self.r1_path_strs: List[str] = [p.relative_path_str for p in self.r1_paths]
+        self.r2_path_strs: List[str] = [p.relative_path_str for p in self.r2_paths]
+
+        # Matching files per pattern, see index_patterns
+        self.r1_index: Dict[str, List[PathObj]] = {}
+        self.r2_index: Dict[str, List[PathObj]] = {}
+
+        # Matched r1 and r2 files per list of patterns
+        self.pair_match_cache: Dict[
+            Tuple[str, ...], Tuple[Optional[PathObj], Optional[PathObj]]
+        ] = {}
+
 
 def get_run_object(
     logger: Logger,
@@ -74,6 +204,7 @@ def get_run_object(
         id2,
         results1,
         results2,
+        get_scan_threads(logger),
     )
 
     return run_object
@@ -3,26 +3,24 @@
 import argparse
 import logging
 import sys
-from configparser import ConfigParser, SectionProxy
+from configparser import SectionProxy
 from pathlib import Path
 from typing import List, Optional, Set, Tuple
 
-from commands.eval.classes.helpers import PathObj, RunSettings
-from commands.eval.classes.run_object import (
-    RunObject,
-    get_files_in_dir,
-    get_run_object,
-)
+from commands.eval.classes.helpers import RunSettings
+from commands.eval.classes.run_object import RunObject, get_run_object
 from commands.eval.main_functions import (
     VCFComparison,
     do_file_diff,
     do_simple_diff,
     do_vcf_comparisons,
 )
-from shared.constants import RUN_ID_PLACEHOLDER, VCFType
+from shared.constants import VCFType
+from shared.util import read_config
 
 from .utils import (
     get_vcf_pair,
+    index_patterns,
     verify_pair_exists,
 )
 
@@ -63,17 +61,9 @@ def main(
     outdir: Optional[Path],
 ):
 
-    r1_paths = get_files_in_dir(
-        ro.r1_results, ro.r1_id, RUN_ID_PLACEHOLDER, ro.r1_results
-    )
-    r2_paths = get_files_in_dir(
-        ro.r2_results, ro.r2_id, RUN_ID_PLACEHOLDER, ro.r2_results
-    )
-
     parent_path = Path(__file__).resolve().parent
     config_path = args_config_path or parent_path / "default.ini"
-    config = ConfigParser()
-    config.read(config_path)
+    config = read_config(config_path)
 
     if not config.has_section(rs.pipeline):
         available_sections = config.sections()
@@ -87,73 +77,70 @@ def main(
 
     run_ids = (ro.r1_id, ro.r2_id)
 
+    # Patterns of the requested comparisons are matched against the results up front
+    pattern_keys = [
+        key
+        for (key, comparisons) in [
+            ("snv_vcf", SNV_COMPARISONS),
+            ("sv_vcf", SV_COMPARISONS),
+            ("scout_yaml", ["scout_yaml"]),
+            ("qc", ["qc"]),
+            ("versions", ["versions"]),
+        ]
+        if not used_comparisons or used_comparisons.intersection(comparisons)
+    ]
+    config_patterns = [
+        pattern
+        for key in pattern_keys
+        if pipe_conf.get(key)
+        for pattern in pipe_conf[key].split(",")
+    ]
+    index_patterns(ro, config_patterns)
+
     verify_pair_exists("result dirs", run_ids, ro.r1_results, ro.r2_results, None)
 
     if outdir is not None:
         outdir.mkdir(parents=True, exist_ok=True)
 
     if not used_comparisons or "file" in used_comparisons:
-        do_file_diff(logger, outdir, pipe_conf, ro, r1_paths, r2_paths)
-
-    snv_patterns = (
-        set(pipe_conf["snv_vcf"].split(",")) if pipe_conf.get("snv_vcf") else set()
-    )
-    main_vcf_comparisons(
-        run_ids,
-        used_comparisons,
-        ro,
-        r1_paths,
-        r2_paths,
-        rs,
-        snv_patterns,
-        outdir,
-        VCFType.snv,
-        rs.custom_info_keys_snv,
-        SNV_COMPARISONS,
-    )
+        do_file_diff(logger, outdir, pipe_conf, ro)
 
-    sv_patterns = (
-        set(pipe_conf["sv_vcf"].split(",")) if pipe_conf.get("sv_vcf") else set()
-    )
-    main_vcf_comparisons(
-        run_ids,
-        used_comparisons,
-        ro,
-        r1_paths,
-        r2_paths,
-        rs,
-        sv_patterns,
-        outdir,
-        VCFType.sv,
-        rs.custom_info_keys_sv,
-        SV_COMPARISONS,
-    )
-
-    scout_yaml_check = "scout_yaml"
-    if not used_comparisons or scout_yaml_check in used_comparisons:
-        do_simple_diff(
-            logger,
+    if not used_comparisons or used_comparisons.intersection(SNV_COMPARISONS):
+        snv_patterns = (
+            set(pipe_conf["snv_vcf"].split(",")) if pipe_conf.get("snv_vcf") else set()
+        )
+        main_vcf_comparisons(
+            run_ids,
+            used_comparisons,
             ro,
-            r1_paths,
-            r2_paths,
-            pipe_conf,
-            scout_yaml_check,
+            rs,
+            snv_patterns,
             outdir,
-            rs.verbose,
+            VCFType.snv,
+            rs.custom_info_keys_snv,
+            SNV_COMPARISONS,
         )
 
-    qc_check = "qc"
-    if not used_comparisons or qc_check in used_comparisons:
-        do_simple_diff(
-            logger, ro, r1_paths, r2_paths, pipe_conf, qc_check, outdir, rs.verbose
+    if not used_comparisons or used_comparisons.intersection(SV_COMPARISONS):
+        sv_patterns = (
+            set(pipe_conf["sv_vcf"].split(",")) if pipe_conf.get("sv_vcf") else set()
         )
-
-    version_check = "versions"
-    if not used_comparisons or version_check in used_comparisons:
-        do_simple_diff(
-            logger, ro, r1_paths, r2_paths, pipe_conf, version_check, outdir, rs.verbose
+        main_vcf_comparisons(
+            run_ids,
+            used_comparisons,
+            ro,
+            rs,
+            sv_patterns,
+            outdir,
+            VCFType.sv,
+            rs.custom_info_keys_sv,
+            SV_COMPARISONS,
         )
 
+    for check in ["scout_yaml", "qc", "versions"]:
+        if not used_comparisons or check in used_comparisons:
+            do_simple_diff(logger, ro, pipe_conf, check, outdir, rs.verbose)
+
 
 def get_comparisons(
     logger: logging.Logger,
@@ -189,8 +176,6 @@ def main_vcf_comparisons(
     run_ids: Tuple[str, str],
     comparisons: Set[str],
     ro: RunObject,
-    r1_paths: List[PathObj],
-    r2_paths: List[PathObj],
     rs: RunSettings,
     vcf_path_patterns: Set[str],
     outdir: Optional[Path],
@@ -213,8 +198,6 @@ def main_vcf_comparisons(
                 logger,
                 list(vcf_path_patterns),
                 ro,
-                r1_paths,
-                r2_paths,
                 rs.verbose,
                 vcf_type,
             )
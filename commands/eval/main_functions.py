@@ -7,7 +7,7 @@ from logging import Logger
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
-from commands.eval.classes.helpers import PathObj, RunSettings, VCFPair
+from commands.eval.classes.helpers import RunSettings, VCFPair
 from commands.eval.classes.run_object import RunObject
 from commands.eval.constants import FILE_NAMES
 from commands.eval.utils import get_ignored, get_pair_match
@@ -160,16 +160,11 @@ def do_vcf_comparisons(
 def check_same_files(
     logger: Logger,
     ro: RunObject,
-    r1_paths: List[PathObj],
-    r2_paths: List[PathObj],
     ignore_files: List[str],
     out_path: Optional[Path],
 ):
 
-    files_in_results1 = set(path.relative_path for path in r1_paths)
-    files_in_results2 = set(path.relative_path for path in r2_paths)
-
-    comparison = do_comparison(files_in_results1, files_in_results2)
+    comparison = do_comparison(ro.r1_relative_paths, ro.r2_relative_paths)
 
     out_fh = open(out_path, "w") if out_path else None
 
@@ -201,7 +196,7 @@ def check_same_files(
 
     if len(ignored) > 0:
         log_and_write(logger, "Ignored", out_fh)
-        for key, val in ignored.items():
+        for key, val in sorted(ignored.items()):
             log_and_write(logger, f"  {key}: {val}", out_fh)
 
     if out_fh:
@@ -213,8 +208,6 @@ def do_file_diff(
     outdir: Optional[Path],
     pipe_conf: SectionProxy,
     ro: RunObject,
-    r1_paths: List[PathObj],
-    r2_paths: List[PathObj],
 ):
     out_path = outdir / "check_sample_files.txt" if outdir else None
     logger.info("")
@@ -226,8 +219,6 @@ def do_file_diff(
     check_same_files(
         logger,
         ro,
-        r1_paths,
-        r2_paths,
         ignore_files,
         out_path,
     )
@@ -256,22 +247,21 @@ def compare_all_vcfs(
             n_variants = 0
         r2_counts[str(vcf).replace(str(ro.r2_results), "")] = n_variants
 
-    paths = r1_counts.keys() | r2_counts.keys()
-
-    max_path_length = max(len(path) for path in paths)
+    sorted_paths = sorted(r1_counts.keys() | r2_counts.keys())
+    max_path_length = max(map(len, sorted_paths), default=0)
+    r1_width = len(ro.r1_id)
+    r2_width = len(ro.r2_id)
+
+    rows = [f"{'Path':<{max_path_length}} {ro.r1_id:>10} {ro.r2_id:>10}"]
+    for path in sorted_paths:
+        r1_val = r1_counts[path] if path in r1_counts else "-"
+        r2_val = r2_counts[path] if path in r2_counts else "-"
+        rows.append(
+            f"{path:<{max_path_length}} {r1_val:>{r1_width}} {r2_val:>{r2_width}}"
+        )
 
     out_fh = open(out_path, "w") if out_path else None
-    log_and_write(
-        logger, f"{'Path':<{max_path_length}} {ro.r1_id:>10} {ro.r2_id:>10}", out_fh
-    )
-    for path in sorted(paths):
-        r1_val = r1_counts.get(path) or "-"
-        r2_val = r2_counts.get(path) or "-"
-        log_and_write(
-            logger,
-            f"{path:<{max_path_length}} {r1_val:>{len(ro.r1_id)}} {r2_val:>{len(ro.r2_id)}}",
-            out_fh,
-        )
+    log_and_write(logger, "\n".join(rows), out_fh)
 
     if out_fh:
         out_fh.close()
@@ -308,8 +298,6 @@ def diff_compare_files(
 def do_simple_diff(
     logger: Logger,
     ro: RunObject,
-    r1_paths: List[PathObj],
-    r2_paths: List[PathObj],
     pipe_conf: SectionProxy,
     analysis: str,
     outdir: Optional[Path],
@@ -328,8 +316,6 @@ def do_simple_diff(
         analysis,
         pipe_conf[analysis].split(","),
         ro,
-        r1_paths,
-        r2_paths,
         verbose,
     )
     if not matched_pair:
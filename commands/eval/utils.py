@@ -1,8 +1,11 @@
 import re
 from collections import defaultdict
+from functools import lru_cache
+from itertools import compress
 from logging import Logger
+from operator import methodcaller
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple, Union
 
 from commands.eval.classes.helpers import VCFPair
 from shared.compare import do_comparison
@@ -11,18 +14,203 @@ from shared.vcf.vcf import parse_scored_vcf
 
 from .classes.run_object import PathObj, RunObject
 
+REGEX_METACHARACTERS = set(".^$*+?{}[]\\|()")
+MULTI_CHAR_ESCAPES = set("xuUN")
 
-def get_files_matching(pattern: str, paths: List[PathObj]) -> List[PathObj]:
-    re_pattern = re.compile(pattern)
-    matching = [path for path in paths if re.search(re_pattern, str(path)) is not None]
+
+def is_escaped(pattern: str, pos: int) -> bool:
+    """Is the character at pos preceded by an odd number of backslashes?"""
+    nbr_backslashes = 0
+    while pos - nbr_backslashes > 0 and pattern[pos - nbr_backslashes - 1] == "\\":
+        nbr_backslashes += 1
+    return nbr_backslashes % 2 == 1
+
+
+def trim_wildcards(pattern: str) -> str:
+    """
+    Leading and trailing '.*' do not change whether re.search finds a match
+    in a path (paths have no newlines), but can cause a lot of backtracking.
+    Note that they can change what is captured by groups.
+    """
+    # Lazy or possessive variants (.*? and .*+) are left as is
+    while pattern.startswith(".*") and pattern[2:3] not in {"?", "+", "{"}:
+        pattern = pattern[2:]
+    if pattern.endswith(".*$") and not is_escaped(pattern, len(pattern) - 3):
+        pattern = pattern[:-3]
+    while pattern.endswith(".*") and not is_escaped(pattern, len(pattern) - 2):
+        pattern = pattern[:-2]
+    return pattern
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str) -> Pattern[str]:
+    return re.compile(pattern)
+
+
+def compile_file_pattern(pattern: str) -> Pattern[str]:
+    """For checking whether a path matches, where captured groups are not used"""
+    return compile_pattern(trim_wildcards(pattern))
+
+
+@lru_cache(maxsize=None)
+def get_literal_pattern(pattern: str) -> Optional[Tuple[str, bool]]:
+    """
+    If the regex pattern only matches a literal string, return the string
+    and whether it is anchored to the end (i.e. 'qc/RUNID\\.QC$').
+    Otherwise return None.
+    """
+    is_suffix = pattern.endswith("$")
+    body = pattern[:-1] if is_suffix else pattern
+
+    literal_chars: List[str] = []
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == "\\":
+            if i + 1 < len(body) and body[i + 1] in REGEX_METACHARACTERS:
+                literal_chars.append(body[i + 1])
+                i += 2
+                continue
+            return None
+        if char in REGEX_METACHARACTERS:
+            return None
+        literal_chars.append(char)
+        i += 1
+
+    return ("".join(literal_chars), is_suffix)
+
+
+@lru_cache(maxsize=None)
+def get_literal_suffix(pattern: str) -> str:
+    """
+    The literal text any match of an end-anchored pattern must end with
+    (i.e. 'gz' for 'vcf/RUNID.vcf.gz$'). Empty if none could be determined.
+    """
+    # Alternatives and inline flags (such as case insensitivity) are not analyzed
+    if "|" in pattern or "(?" in pattern:
+        return ""
+    if not pattern.endswith("$") or is_escaped(pattern, len(pattern) - 1):
+        return ""
+
+    suffix_chars: List[str] = []
+    pos = len(pattern) - 2
+    while pos >= 0:
+        char = pattern[pos]
+        if is_escaped(pattern, pos):
+            if char not in REGEX_METACHARACTERS:
+                # Octal, hex and unicode escapes (such as \101 and \x41) span
+                # the characters collected so far, which are then not literal
+                if char.isdigit() or char in MULTI_CHAR_ESCAPES:
+                    return ""
+                # Character classes such as \w
+                break
+            suffix_chars.append(char)
+            pos -= 2
+            continue
+        if char in REGEX_METACHARACTERS:
+            # A preceding character may be made optional by a quantifier
+            break
+        suffix_chars.append(char)
+        pos -= 1
+
+    return "".join(reversed(suffix_chars))
+
+
+def get_files_matching(
+    pattern: str, paths: List[PathObj], path_strs: List[str]
+) -> List[PathObj]:
+    """
+    path_strs are the pre-computed str(path) for each entry in paths.
+    The checks are mapped over all paths using map and compress, which keeps
+    the loops in C rather than in Python bytecode.
+    """
+
+    # Plain string checks are used where the pattern allows it
+    literal_pattern = get_literal_pattern(pattern)
+    if literal_pattern is not None:
+        (literal, is_suffix) = literal_pattern
+        string_check = methodcaller(
+            "endswith" if is_suffix else "__contains__", literal
+        )
+        return list(compress(paths, map(string_check, path_strs)))
+
+    # Cheap check of the literal ending before running the regex
+    suffix = get_literal_suffix(pattern)
+    if suffix:
+        has_suffix = list(map(methodcaller("endswith", suffix), path_strs))
+        paths = list(compress(paths, has_suffix))
+        path_strs = list(compress(path_strs, has_suffix))
+
+    re_pattern = compile_file_pattern(pattern)
+    matching = list(compress(paths, map(re_pattern.search, path_strs)))
     return matching
 
 
-def get_single_matching(
-    patterns: List[str], paths: List[PathObj]
+DEFAULT_FLAGS = re.compile("").flags
+BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def can_combine_pattern(pattern: str) -> bool:
+    """
+    Can the pattern be part of a joined alternation? Inline global flags
+    (such as '(?i)') must start the expression, named groups cannot be
+    repeated and numbered backreferences shift between the alternatives.
+    """
+    try:
+        compiled = compile_file_pattern(pattern)
+    except re.error:
+        return False
+    if compiled.flags != DEFAULT_FLAGS or compiled.groupindex:
+        return False
+    return BACKREFERENCE.search(pattern) is None
+
+
+@lru_cache(maxsize=None)
+def get_combined_pattern(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """One pattern matching any of the patterns, None if they cannot be combined"""
+    if not all(can_combine_pattern(pattern) for pattern in patterns):
+        return None
+    return compile_pattern(
+        "|".join(f"(?:{trim_wildcards(pattern)})" for pattern in patterns)
+    )
+
+
+def get_matching_per_pattern(
+    patterns: List[str], paths: List[PathObj], path_strs: List[str]
+) -> Dict[str, List[PathObj]]:
+    """All files matching each of the patterns"""
+
+    # Single scan over all paths to find those matching any of the patterns
+    suffixes = tuple(get_literal_suffix(pattern) for pattern in patterns)
+    candidates = [
+        (path, path_str)
+        for (path, path_str) in zip(paths, path_strs)
+        if path_str.endswith(suffixes)
+    ]
+    # Otherwise, the patterns are checked one by one below
+    combined_pattern = get_combined_pattern(tuple(patterns))
+    if combined_pattern is not None:
+        candidates = [
+            (path, path_str)
+            for (path, path_str) in candidates
+            if combined_pattern.search(path_str) is not None
+        ]
+    candidate_paths = [path for (path, _) in candidates]
+    candidate_strs = [path_str for (_, path_str) in candidates]
+
+    return {
+        pattern: get_files_matching(pattern, candidate_paths, candidate_strs)
+        for pattern in patterns
+    }
+
+
+def select_single_match(
+    patterns: List[str], matching_per_pattern: Dict[str, List[PathObj]]
 ) -> Union[PathObj, None]:
+
+    # Patterns are checked in priority order
     for pattern in patterns:
-        matching = get_files_matching(pattern, paths)
+        matching = matching_per_pattern[pattern]
         if len(matching) > 1:
             matches = [str(match) for match in matching]
             raise ValueError(
@@ -33,15 +221,44 @@ def get_single_matching(
     return None
 
 
+def index_patterns(ro: RunObject, patterns: List[str]):
+    """
+    Look up the files matching each pattern in both runs.
+    Indexing all patterns from the config at once needs a single scan per run.
+    """
+    new_patterns = [
+        pattern for pattern in dict.fromkeys(patterns) if pattern not in ro.r1_index
+    ]
+    if not new_patterns:
+        return
+    ro.r1_index.update(
+        get_matching_per_pattern(new_patterns, ro.r1_paths, ro.r1_path_strs)
+    )
+    ro.r2_index.update(
+        get_matching_per_pattern(new_patterns, ro.r2_paths, ro.r2_path_strs)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_parent_names_pattern(names: Tuple[str, ...]) -> Pattern[str]:
+    """Matches any of the names as a full folder name within a path"""
+    return re.compile("(?:^|/)(?:" + "|".join(re.escape(name) for name in names) + ")/")
+
+
 def any_is_parent(path: Path, names: List[str]) -> bool:
     """
     Among all parent dirs, does any match 'names'?
     Useful to filter files in ignored folders
     """
-    for parent in path.parents:
-        if parent.name in names:
-            return True
-    return False
+    # The outermost parent ('.' or '/') has an empty name
+    if "" in names:
+        return True
+    # Names with a slash can never equal a single folder name
+    folder_names = tuple(name for name in names if "/" not in name)
+    if not folder_names:
+        return False
+    parent_names_pattern = get_parent_names_pattern(folder_names)
+    return parent_names_pattern.search(str(path)) is not None
 
 
 def verify_pair_exists(
@@ -81,10 +298,10 @@ def get_pair_matches(
     r2_paths: List[PathObj],
 ) -> List[Tuple[SampleMatch, SampleMatch]]:
 
-    re_pattern = re.compile(valid_pattern)
+    re_pattern = compile_pattern(valid_pattern)
 
     def get_match(path: PathObj) -> Optional[SampleMatch]:
-        match = re.search(re_pattern, str(path.real_path))
+        match = re_pattern.search(path.real_path_str)
         if match:
             sample_id = match.groups()[0]
             match_obj = SampleMatch(sample_id, path.real_path)
@@ -119,13 +336,18 @@ def get_pair_match(
     error_label: str,
     valid_patterns: List[str],
     ro: RunObject,
-    r1_paths: List[PathObj],
-    r2_paths: List[PathObj],
     verbose: bool,
 ) -> Optional[Tuple[Path, Path]]:
 
-    r1_matching = get_single_matching(valid_patterns, r1_paths)
-    r2_matching = get_single_matching(valid_patterns, r2_paths)
+    # Patterns are checked in priority order, so the order is part of the key
+    cache_key = tuple(valid_patterns)
+    if cache_key not in ro.pair_match_cache:
+        index_patterns(ro, valid_patterns)
+        ro.pair_match_cache[cache_key] = (
+            select_single_match(valid_patterns, ro.r1_index),
+            select_single_match(valid_patterns, ro.r2_index),
+        )
+    (r1_matching, r2_matching) = ro.pair_match_cache[cache_key]
     if verbose:
         if r1_matching is not None:
             logger.info(
@@ -158,19 +380,61 @@ def get_pair_match(
     return (r1_matching.real_path, r2_matching.real_path)
 
 
+def get_name_mask(names: Iterable[str]) -> int:
+    """
+    Tiny bloom filter over names, one bit per name (64 bits in total).
+    If the masks of two name collections share no bits, they share no names.
+    """
+    mask = 0
+    for name in names:
+        mask |= 1 << (hash(name) & 63)
+    return mask
+
+
+def iter_non_ignored(
+    result_paths: Iterable[Path],
+    ignore_files: List[str],
+    nbr_ignored_per_pattern: Dict[str, int],
+) -> Iterator[Path]:
+    """
+    Yields the paths not in an ignored folder.
+    Ignored paths are tallied per parent folder in nbr_ignored_per_pattern.
+    """
+
+    ignore_mask = get_name_mask(ignore_files)
+    # The outermost parent ('.' or '/') has an empty name
+    root_mask = get_name_mask([""])
+
+    # Files in the same folder share the outcome, so each folder is only checked once
+    is_ignored_per_parent: Dict[Path, bool] = {}
+
+    for path in result_paths:
+        parent = path.parent
+        if parent not in is_ignored_per_parent:
+            parent_mask = get_name_mask(path.parts[:-1]) | root_mask
+            may_be_ignored = (parent_mask & ignore_mask) != 0
+            is_ignored_per_parent[parent] = may_be_ignored and any_is_parent(
+                path, ignore_files
+            )
+
+        if is_ignored_per_parent[parent]:
+            nbr_ignored_per_pattern[str(parent)] += 1
+        else:
+            yield path
+
+
 def get_ignored(
     result_paths: Set[Path], ignore_files: List[str]
 ) -> Tuple[Dict[str, int], List[Path]]:
+    """
+    Count ignored paths per folder and return the remaining paths, unordered.
+    """
 
     nbr_ignored_per_pattern: Dict[str, int] = defaultdict(int)
 
-    non_ignored: List[Path] = []
-    for path in sorted(result_paths):
-        if any_is_parent(path, ignore_files):
-            parent = str(path.parent)
-            nbr_ignored_per_pattern[parent] += 1
-        else:
-            non_ignored.append(path)
+    non_ignored = list(
+        iter_non_ignored(result_paths, ignore_files, nbr_ignored_per_pattern)
+    )
 
     return (nbr_ignored_per_pattern, non_ignored)
 
@@ -179,8 +443,6 @@ def get_vcf_pair(
     logger: Logger,
     vcf_paths: List[str],
     ro: RunObject,
-    r1_paths: List[PathObj],
-    r2_paths: List[PathObj],
     verbose: bool,
     vcf_type: VCFType,
 ) -> Optional[VCFPair]:
@@ -189,8 +451,6 @@ def get_vcf_pair(
         vcf_type.value,
         vcf_paths,
         ro,
-        r1_paths,
-        r2_paths,
         verbose,
     )
 
@@ -225,8 +485,8 @@ def parse_vcf_pair(
     logger.info(f"{run_ids[1]} number variants: {len(vcf_r2.variants)}")
 
     comp_res = do_comparison(
-        set(vcf_r1.variants.keys()),
-        set(vcf_r2.variants.keys()),
+        vcf_r1.variants.keys(),
+        vcf_r2.variants.keys(),
     )
     logger.info(f"In common: {len(comp_res.shared)}")
     logger.info(f"Only in {run_ids[0]}: {len(comp_res.r1)}")
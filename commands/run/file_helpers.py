@@ -1,5 +1,8 @@
+import os
+import re
+import shutil
 import sys
-from datetime import datetime
+from datetime import date
 from logging import Logger
 from pathlib import Path
 from typing import Dict, List
@@ -12,9 +15,10 @@ from commands.run.help_classes.config_classes import (
 
 
 def write_resume_script(results_dir: Path, run_command: List[str]):
-    resume_command = run_command + ["--resume"]
+    resume_command = f"{' '.join(run_command)} --resume"
     resume_script = results_dir / "resume.sh"
-    resume_script.write_text(" ".join(resume_command))
+    resume_script.write_text(resume_command)
+    resume_script.chmod(0o755)
 
 
 def copy_nextflow_configs(repo: Path, results_dir: Path, configs: List[Path]):
@@ -22,7 +26,8 @@ def copy_nextflow_configs(repo: Path, results_dir: Path, configs: List[Path]):
     for config in configs:
         config_path = repo / config
         dest_path = results_dir / config.name
-        dest_path.write_text(config_path.read_text())
+        # Copied as bytes, using os.sendfile where available
+        shutil.copyfile(config_path, dest_path)
 
 
 def setup_results_links(
@@ -37,32 +42,42 @@ def setup_results_links(
     trace_base_dir = config.general_settings.trace_base_dir
     work_base_dir = config.general_settings.work_base_dir
 
-    current_date = datetime.now()
-    date_stamp = current_date.strftime("%Y-%m-%d")
+    # ISO format is YYYY-MM-DD, without going through the locale aware strftime
+    date_stamp = date.today().isoformat()
 
-    log_link = results_dir / "nextflow.log"
-    trace_link = results_dir / "trace.txt"
-    work_link = results_dir / "work"
+    # Plain strings, as the paths are only passed on to os.symlink
+    results_dir_str = str(results_dir)
+    log_link = os.path.join(results_dir_str, "nextflow.log")
+    trace_link = os.path.join(results_dir_str, "trace.txt")
+    work_link = os.path.join(results_dir_str, "work")
 
-    log_link_target = Path(f"{log_base_dir}/{run_label}.{assay}.{date_stamp}.log")
-    trace_link_target = Path(f"{trace_base_dir}/{run_label}.{assay}.trace.txt")
-    work_link_target = Path(f"{work_base_dir}/{run_label}.{assay}")
-
-    if log_link.exists():
-        logger.warning(f"{log_link} already exists, removing previous link")
-        log_link.unlink()
+    log_link_target = os.path.join(
+        log_base_dir, f"{run_label}.{assay}.{date_stamp}.log"
+    )
+    trace_link_target = os.path.join(trace_base_dir, f"{run_label}.{assay}.trace.txt")
+    work_link_target = os.path.join(work_base_dir, f"{run_label}.{assay}")
 
-    if trace_link.exists():
-        logger.warning(f"{trace_link} already exists, removing previous link")
-        trace_link.unlink()
+    replace_link(logger, log_link, log_link_target)
+    replace_link(logger, trace_link, trace_link_target)
+    replace_link(logger, work_link, work_link_target)
 
-    if work_link.exists():
-        logger.warning(f"{work_link} already exists, removing previous link")
-        work_link.unlink()
 
-    log_link.symlink_to(log_link_target)
-    trace_link.symlink_to(trace_link_target)
-    work_link.symlink_to(work_link_target)
+def replace_link(logger: Logger, link: str, target: str):
+    """
+    The link is created directly. If it already exists, a new link is created
+    next to it and renamed over the old one, so the link is never missing.
+    """
+    try:
+        os.symlink(target, link)
+    except FileExistsError:
+        logger.warning(f"{link} already exists, replacing previous link")
+        tmp_link = f"{link}.tmp"
+        try:
+            os.unlink(tmp_link)
+        except FileNotFoundError:
+            pass
+        os.symlink(target, tmp_link)
+        os.replace(tmp_link, link)
 
 
 def get_replace_map(
@@ -87,40 +102,36 @@ def get_replace_map(
     )
 
     # Additional run profile attributes (analysis, default-panel etc)
+    # setdefault keeps values already assigned by the special rules
     for attr, val in run_profile.items():
-        placeholder = f"<{attr}>"
-        if placeholder not in replace_map:
-            replace_map[placeholder] = val
+        replace_map.setdefault(f"<{attr}>", val)
 
     # Additional sample attributes (sample type, sex etc)
     for sample_config in sample_configs:
 
         sample_type = sample_config.sample_type
         for attr, val in sample_config.items():
-            placeholder = f"<{attr} {sample_type}>"
-            if placeholder not in replace_map:
-                replace_map[placeholder] = val
+            replace_map.setdefault(f"<{attr} {sample_type}>", val)
 
     return replace_map
 
 
-def get_csv(
+def write_csv(
     logger: Logger,
     config: RunConfig,
     run_label: str,
     starting_run_from: str,
     csv_base: Path,
-) -> str:
+    out_csv: Path,
+):
+    """
+    Fill in the CSV template and write it to out_csv.
+    Rows are written as they are read from the template.
+    """
 
     csv_template_name = config.run_profile.csv_template
     csv_template_path = csv_base / csv_template_name
 
-    csv_rows = csv_template_path.read_text().strip().split("\n")
-    csv_header = csv_rows[0]
-    csv_body_rows = csv_rows[1:]
-
-    updated_rows = [csv_header]
-
     replace_map = get_replace_map(
         logger,
         starting_run_from,
@@ -129,14 +140,21 @@ def get_csv(
         config.run_profile,
     )
 
-    for i, row in enumerate(csv_body_rows):
-
-        for key, val in replace_map.items():
-            row = row.replace(key, val)
-
-        updated_rows.append(row)
-
-    return "\n".join(updated_rows)
+    # All placeholders are replaced in a single scan of each row
+    # Longer placeholders first, in case one placeholder is a prefix of another
+    placeholders = sorted(replace_map, key=len, reverse=True)
+    placeholder_pattern = re.compile("|".join(re.escape(key) for key in placeholders))
+
+    with csv_template_path.open() as template_fh, out_csv.open("w") as out_fh:
+        # Blank lines in the template are skipped
+        template_rows = (row for row in template_fh if row.strip())
+        csv_header = next(template_rows, "")
+        out_fh.write(csv_header)
+        for row in template_rows:
+            row = placeholder_pattern.sub(
+                lambda match: replace_map[match.group(0)], row
+            )
+            out_fh.write(row)
 
 
 def write_run_log(
@@ -147,21 +165,22 @@ def write_run_log(
     config: RunConfig,
     commit_hash: str,
 ):
-    with run_log_path.open("w") as out_fh:
-        print("# Settings", file=out_fh)
-        print(f"output dir: {run_log_path.parent}", file=out_fh)
-        print(f"run profile: {run_profile}", file=out_fh)
-        print(f"run label: {label}", file=out_fh)
-        print(f"checkout: {checkout_str}", file=out_fh)
-        print(f"commit hash: {commit_hash}", file=out_fh)
-        print("", file=out_fh)
-        print("# Config file - settings", file=out_fh)
-        for key, val in config.get_setting_entries().items():
-            print(f"{key}: {val}", file=out_fh)
-
-        print(f"# Config file - {run_profile}", file=out_fh)
-        for key, val in config.get_profile_entries().items():
-            print(f"{key}: {val}", file=out_fh)
+    lines = [
+        "# Settings",
+        f"output dir: {run_log_path.parent}",
+        f"run profile: {run_profile}",
+        f"run label: {label}",
+        f"checkout: {checkout_str}",
+        f"commit hash: {commit_hash}",
+        "",
+        "# Config file - settings",
+    ]
+    lines.extend(f"{key}: {val}" for key, val in config.get_setting_entries().items())
+
+    lines.append(f"# Config file - {run_profile}")
+    lines.extend(f"{key}: {val}" for key, val in config.get_profile_entries().items())
+
+    run_log_path.write_text("".join(f"{line}\n" for line in lines))
 
 
 def get_replace_map_special_rules(
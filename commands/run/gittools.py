@@ -1,3 +1,5 @@
+import os
+import stat
 import subprocess
 from logging import Logger
 from pathlib import Path
@@ -11,19 +13,23 @@ class CompletedProcess:
         self.stderr = stderr
 
 
-def run_command(command: List[str], repo: Path) -> CompletedProcess:
+def run_command(
+    command: List[str], repo: Path, capture_stdout: bool = True
+) -> CompletedProcess:
     results = subprocess.run(
         command,
         cwd=str(repo),
         # text=True is supported from Python 3.7
         universal_newlines=True,
-        stdout=subprocess.PIPE,
+        stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
         stderr=subprocess.PIPE,
         check=True,
     )
 
     # Temporary fix to get the type hintings running on Python3.6
-    results_local = CompletedProcess(results.returncode, results.stdout, results.stderr)
+    results_local = CompletedProcess(
+        results.returncode, results.stdout or "", results.stderr
+    )
     return results_local
 
 
@@ -33,7 +39,8 @@ def fetch_repo(
     command = ["git", "fetch", remote]
     if verbose:
         logger.info(f"Executing: {command} in {repo}")
-    results = run_command(command, repo)
+    # Only stderr is used from the fetch
+    results = run_command(command, repo, capture_stdout=False)
     return (results.returncode, results.stderr)
 
 
@@ -69,20 +76,26 @@ def pull_branch(
 def get_git_commit_hash_and_log(
     logger: Logger, repo: Path, verbose: bool
 ) -> Tuple[str, str]:
-    command = ["git", "log", "--oneline"]
+    # Same output as the first line of 'git log --oneline', without walking the history
+    command = ["git", "log", "-1", "--pretty=format:%h %s"]
     if verbose:
         logger.info(f"Executing: {command} in {repo}")
     results = run_command(command, repo)
-    last_log = results.stdout.splitlines()[0]
-    commit_hash = last_log.split(" ")[0]
+    last_log = results.stdout.rstrip("\n")
+    commit_hash = last_log.split(" ", 1)[0]
     return (commit_hash, last_log)
 
 
 def check_valid_repo(repo: Path) -> Tuple[int, str]:
-    if not repo.exists():
+    # A single stat tells both whether the repo exists and whether it is a folder
+    try:
+        repo_stat = os.stat(repo)
+    except (FileNotFoundError, NotADirectoryError):
         return (1, f'The folder "{repo}" does not exist')
+    except OSError as err:
+        return (1, f'Could not access the folder "{repo}": {err}')
 
-    if not repo.is_dir():
+    if not stat.S_ISDIR(repo_stat.st_mode):
         return (1, f'"{repo}" is not a folder')
 
     if not (repo / ".git").is_dir():
@@ -1,10 +1,9 @@
 import sys
-from configparser import ConfigParser
 from logging import Logger
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional
 
-from shared.util import parse_bool_from_string
+from shared.util import parse_bool_from_string, read_config
 
 DEFAULT_SECTION = "default"
 
@@ -21,8 +20,33 @@ def parse_mandatory_section_argument(
     return section[target_key]
 
 
+def check_mandatory_section_arguments(
+    logger: Logger, section: Dict[str, str], section_name: str, target_keys: List[str]
+):
+    """Report all missing mandatory settings at once, rather than the first one"""
+    missing_keys = [key for key in target_keys if not section.get(key)]
+    if missing_keys:
+        missing = ", ".join(f'"{key}"' for key in missing_keys)
+        existing_fields = section.keys()
+        logger.error(
+            f'Mandatory settings {missing} not defined in config section "{section_name}". (Currently defined fields are : {", ".join(existing_fields)})'
+        )
+        sys.exit(1)
+
+
 class SampleConfig:
 
+    __slots__ = (
+        "config_section",
+        "id",
+        "sex",
+        "fq_fw",
+        "fq_rv",
+        "bam",
+        "vcf",
+        "sample_type",
+    )
+
     config_section: Dict[str, str]
 
     id: str
@@ -64,6 +88,18 @@ class SampleConfig:
 
 class RunProfileConfig:
 
+    __slots__ = (
+        "config_section",
+        "case_type",
+        "pipeline",
+        "run_profile",
+        "pipeline_profile",
+        "samples",
+        "sample_types",
+        "default_panel",
+        "csv_template",
+    )
+
     # config: ConfigParser
     config_section: Dict[str, str]
 
@@ -90,17 +126,18 @@ class RunProfileConfig:
         self.run_profile = run_profile
         self.config_section = profile_section
 
-        self.pipeline = parse_mandatory_section_argument(
-            logger, profile_section, profile_section_name, "pipeline"
+        check_mandatory_section_arguments(
+            logger,
+            profile_section,
+            profile_section_name,
+            ["pipeline", "csv_template", "samples"],
         )
+
+        self.pipeline = profile_section["pipeline"]
         self.pipeline_profile = profile_section.get("pipeline_profile")
-        self.csv_template = parse_mandatory_section_argument(
-            logger, profile_section, profile_section_name, "csv_template"
-        )
+        self.csv_template = profile_section["csv_template"]
 
-        samples_str = parse_mandatory_section_argument(
-            logger, profile_section, profile_section_name, "samples"
-        )
+        samples_str = profile_section["samples"]
         self.samples = samples_str.split(",")
 
         sample_types_str = profile_section.get("sample_types")
@@ -152,8 +189,32 @@ class RunProfileConfig:
 
 class PipelineSettingsConfig:
 
+    __slots__ = (
+        "_default_settings",
+        "_pipeline_settings",
+        "_settings",
+        "pipeline",
+        "start_nextflow_analysis",
+        "log_base_dir",
+        "trace_base_dir",
+        "work_base_dir",
+        "repo",
+        "out_base",
+        "baseline_repo",
+        "datestamp",
+        "queue",
+        "executor",
+        "cluster",
+        "nextflow_configs",
+        "singularity_version",
+        "nextflow_version",
+        "container",
+        "runscript",
+    )
+
     _default_settings: Dict[str, str]
     _pipeline_settings: Dict[str, str]
+    _settings: Dict[str, str]
     raw_config = Dict[str, str]
 
     pipeline: str
@@ -177,6 +238,24 @@ class PipelineSettingsConfig:
     container: str
     runscript: str
 
+    # String settings as (attribute, key in config, mandatory)
+    _string_settings = [
+        ("singularity_version", "singularity_version", True),
+        ("nextflow_version", "nextflow_version", True),
+        ("container", "container", True),
+        ("runscript", "runscript", True),
+        ("start_nextflow_analysis", "start_nextflow_analysis", True),
+        ("log_base_dir", "log_base_dir", True),
+        ("trace_base_dir", "trace_base_dir", True),
+        ("work_base_dir", "work_base_dir", True),
+        ("repo", "repo", True),
+        ("baseline_repo", "baseline_repo", False),
+        ("out_base", "base", True),
+        ("queue", "queue", True),
+        ("executor", "executor", True),
+        ("cluster", "cluster", True),
+    ]
+
     def __init__(
         self,
         logger: Logger,
@@ -190,97 +269,58 @@ class PipelineSettingsConfig:
         self._default_settings = default_settings
         self._pipeline_settings = pipeline_settings
 
-        self.singularity_version = str(
-            self._parse_setting(logger, "singularity_version")
+        # Non-empty pipeline settings take precedence over non-empty defaults
+        self._settings = {key: val for (key, val) in default_settings.items() if val}
+        self._settings.update(
+            (key, val) for (key, val) in pipeline_settings.items() if val
         )
-        self.nextflow_version = str(self._parse_setting(logger, "nextflow_version"))
-        self.container = str(self._parse_setting(logger, "container"))
-        self.runscript = str(self._parse_setting(logger, "runscript"))
 
-        self.start_nextflow_analysis = str(
-            self._parse_setting(logger, "start_nextflow_analysis")
-        )
-        self.log_base_dir = str(self._parse_setting(logger, "log_base_dir"))
-        self.trace_base_dir = str(self._parse_setting(logger, "trace_base_dir"))
-        self.work_base_dir = str(self._parse_setting(logger, "work_base_dir"))
-        self.repo = str(self._parse_setting(logger, "repo"))
-        self.baseline_repo = str(
-            self._parse_setting(
-                logger,
-                "baseline_repo",
-                mandatory=False,
+        mandatory_keys = [
+            key for (_, key, mandatory) in self._string_settings if mandatory
+        ]
+        mandatory_keys.extend(["datestamp", "nextflow_configs"])
+        missing_keys = [key for key in mandatory_keys if key not in self._settings]
+        if missing_keys:
+            missing = ", ".join(f'"{key}"' for key in missing_keys)
+            logger.error(
+                f'Did not find settings {missing} in neither "{self.pipeline}" or "{DEFAULT_SECTION}"'
             )
-        )
-        self.out_base = str(self._parse_setting(logger, "base"))
-        self.datestamp: bool = self._parse_setting(
-            logger, "datestamp", data_type="bool"
-        )  # type: ignore[assignment]
+            sys.exit(1)
+
+        # Mandatory settings are checked above, optional ones missing become "None"
+        for attr, setting_key, _ in self._string_settings:
+            setattr(self, attr, str(self._settings.get(setting_key)))
+
+        self.datestamp = parse_bool_from_string(self._settings["datestamp"])
 
         self.nextflow_configs = [
-            Path(p) for p in self._parse_list(logger, "nextflow_configs")
+            Path(p) for p in self._settings["nextflow_configs"].split(",")
         ]
 
-        self.queue = str(self._parse_setting(logger, "queue"))
-        self.executor = str(self._parse_setting(logger, "executor"))
-        self.cluster = str(self._parse_setting(logger, "cluster"))
-
     def get_items(self):
-
-        combined_settings = {}
-        for key, val in self._default_settings.items():
-            combined_settings[key] = val
-
-        for key, val in self._pipeline_settings.items():
-            combined_settings[key] = val
-
+        combined_settings = {**self._default_settings, **self._pipeline_settings}
         return combined_settings.items()
 
-    def _parse_list(
-        self, logger: Logger, setting_key: str, mandatory: bool = True
-    ) -> List[str]:
-        raw_str = str(self._parse_setting(logger, setting_key, "string", mandatory))
-        return raw_str.split(",")
-
-    def _parse_setting(
-        self,
-        logger: Logger,
-        setting_key: str,
-        data_type: str = "string",
-        mandatory: bool = True,
-    ) -> Union[str, bool, None]:
-        target_section = None
-        if self._pipeline_settings.get(setting_key):
-            target_section = self._pipeline_settings
-        elif self._default_settings.get(setting_key):
-            target_section = self._default_settings
-
-        if not target_section and mandatory:
-            logger.error(
-                f'Did not find setting "{setting_key}" in neither "{self.pipeline}" or "{DEFAULT_SECTION}"'
-            )
-            sys.exit(1)
-
-        if not target_section:
-            return None
-
-        if data_type == "string":
-            return target_section[setting_key]
-        elif data_type == "bool":
-            str_value = target_section[setting_key]
-            return parse_bool_from_string(str_value)
-        else:
-            raise ValueError(
-                f"Unknown data_type: {data_type}, known are string and bool"
-            )
-
 
 class RunConfig:
 
+    __slots__ = (
+        "run_profile_key",
+        "run_profile",
+        "general_settings",
+        "all_samples",
+        "_setting_entries",
+        "_profile_entries",
+    )
+
     run_profile_key: str
     run_profile: RunProfileConfig
     general_settings: PipelineSettingsConfig
     all_samples: Dict[str, SampleConfig]
 
+    _setting_entries: Dict[str, str]
+    _profile_entries: Dict[str, str]
+
     def __init__(
         self,
         logger: Logger,
@@ -300,8 +340,11 @@ class RunConfig:
             logger, str(pipeline_config_path)
         )
 
-        sample_config_parser = ConfigParser()
-        sample_config_parser.read(sample_config_path)
+        # The settings do not change after loading, so the entries are collected once
+        self._setting_entries = dict(self.general_settings.get_items())
+        self._profile_entries = dict(self.run_profile.items())
+
+        sample_config_parser = read_config(sample_config_path)
 
         sample_types = self.run_profile.sample_types
 
@@ -324,23 +367,15 @@ class RunConfig:
         return case_settings
 
     def get_setting_entries(self) -> Dict[str, str]:
-        key_vals = {}
-        for key, val in self.general_settings.get_items():
-            key_vals[key] = val
-        return key_vals
+        return self._setting_entries
 
     def get_profile_entries(self) -> Dict[str, str]:
-
-        key_vals = {}
-        for key, val in self.run_profile.items():
-            key_vals[key] = val
-        return key_vals
+        return self._profile_entries
 
     def _get_run_profile_config(
         self, logger: Logger, path: str, run_profile: str
     ) -> RunProfileConfig:
-        config = ConfigParser()
-        config.read(path)
+        config = read_config(path)
         if run_profile not in config.keys():
             ignore = {"DEFAULT"}
             available = ", ".join(set(config.keys()) - ignore)
@@ -358,8 +393,7 @@ class RunConfig:
     def _get_pipeline_config(
         self, logger: Logger, pipeline_config_path: str
     ) -> PipelineSettingsConfig:
-        pipeline_config = ConfigParser()
-        pipeline_config.read(pipeline_config_path)
+        pipeline_config = read_config(pipeline_config_path)
         if self.run_profile.pipeline not in pipeline_config.keys():
             available = ", ".join(pipeline_config.keys())
             logger.error(
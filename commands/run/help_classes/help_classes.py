@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import List, Optional
 
 
@@ -102,6 +103,4 @@ class CsvEntry:
         return "\n".join(rows)
 
     def write_to_file(self, out_path: str):
-        with open(out_path, "w") as out_fh:
-            print(self.header_str(), file=out_fh)
-            print(str(self), file=out_fh)
+        Path(out_path).write_text(f"{self.header_str()}\n{self}\n")
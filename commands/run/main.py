@@ -4,15 +4,14 @@ import argparse
 import logging
 import subprocess
 import sys
-from configparser import ConfigParser
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
 from commands.run.file_helpers import (
     copy_nextflow_configs,
-    get_csv,
     setup_results_links,
+    write_csv,
     write_resume_script,
     write_run_log,
 )
@@ -28,6 +27,7 @@ from commands.run.gittools import (
 )
 from commands.run.help_classes.config_classes import RunConfig
 from shared.constants import ASSAY_PLACEHOLDER
+from shared.util import read_config
 
 description = """
 The intent of this script is to make running control samples on specific versions of pipelines easy.
@@ -109,9 +109,7 @@ def main(
     analysis = analysis or config.run_profile.run_profile
 
     out_csv = results_dir / "run.csv"
-    csv_content = get_csv(logger, config, run_label, start_data, csv_base)
-
-    out_csv.write_text(csv_content)
+    write_csv(logger, config, run_label, start_data, csv_base, out_csv)
 
     def get_start_nextflow_command(quote_pipeline_arguments: bool) -> List[str]:
         command = build_start_nextflow_analysis_cmd(
@@ -152,8 +150,7 @@ def get_default_run_profiles() -> List[str]:
     config_path = Path(__file__).resolve().parent / "config/run_profile.ini"
     if not config_path.exists():
         return []
-    config = ConfigParser()
-    config.read(config_path)
+    config = read_config(config_path)
     return sorted(config.sections())
 
 
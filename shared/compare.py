@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Generic, List, Optional, Set, Tuple, TypeVar
+from typing import Generic, KeysView, List, Optional, Set, Tuple, TypeVar, Union
 
 from shared.util import parse_decimal
 
@@ -72,8 +72,13 @@ class ColumnComparison:
         self.all_numeric = all_numeric
 
 
-def do_comparison(set_1: Set[T], set_2: Set[T]) -> Comparison[T]:
-    """Can compare both str and Path objects, thus the generics"""
+def do_comparison(
+    set_1: Union[Set[T], KeysView[T]], set_2: Union[Set[T], KeysView[T]]
+) -> Comparison[T]:
+    """
+    Can compare both str and Path objects, thus the generics.
+    Dict key views can be passed directly, without first copying them into sets.
+    """
     common = set_1 & set_2
     s1_only = set_1 - set_2
     s2_only = set_2 - set_1
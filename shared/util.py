@@ -1,9 +1,11 @@
 import math
+import os
 import statistics
 from configparser import ConfigParser
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Union
 
 
 def prettify_rows(rows: List[List[Any]], padding: int = 4) -> List[str]:
@@ -32,6 +34,29 @@ def check_valid_config_path(conf: ConfigParser, section: str, key: str) -> bool:
     return valid_path
 
 
+@lru_cache(maxsize=None)
+def parse_config(path: str, mtime_ns: int, size: int) -> ConfigParser:
+    """mtime_ns and size are part of the cache key, so that edited files are re-read"""
+    config = ConfigParser(interpolation=None)
+    # The caller has already checked the file, so errors on opening are raised
+    with open(path) as fh:
+        config.read_file(fh)
+    return config
+
+
+def read_config(path: Union[str, Path]) -> ConfigParser:
+    """
+    Parsed INI config, reused as long as the file is unchanged.
+    The parser is shared between calls and should not be modified.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # As for ConfigParser.read, a missing file gives an empty config
+        return ConfigParser(interpolation=None)
+    return parse_config(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 def truncate_string(text: str, max_len: int) -> str:
     if len(text) > max_len:
         return text[0:max_len] + "..."
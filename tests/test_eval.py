@@ -134,3 +134,20 @@ def test_eval_main(
 
     sv_score = (outdir / "scored_sv_all_diffing.txt").read_text().splitlines()
     assert any("<DEL>" in line for line in sv_score)
+
+
+def test_eval_main_subset_comparisons(mock_results: tuple[Path, Path, Path]):
+    """
+    Only the requested comparisons should produce output files
+    """
+    results1, results2, outdir = mock_results
+
+    run_object = RunObject("r1", "r2", results1, results2)
+    run_settings = RunSettings("dna-const", score_threshold=17)
+
+    main(run_object, run_settings, None, {"qc", "versions"}, outdir)
+
+    assert (outdir / "qc.diff").exists()
+    assert (outdir / "versions.diff").exists()
+    assert not (outdir / "scored_snv_presence.txt").exists()
+    assert not (outdir / "scored_sv_presence.txt").exists()
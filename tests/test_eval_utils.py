@@ -0,0 +1,172 @@
+import logging
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from commands.eval.classes import run_object
+from commands.eval.classes.run_object import (
+    RunObject,
+    detect_run_id,
+    get_files_in_dir,
+)
+from commands.eval.utils import (
+    any_is_parent,
+    get_ignored,
+    get_literal_pattern,
+    get_literal_suffix,
+    get_pair_match,
+    index_patterns,
+    trim_wildcards,
+)
+
+
+def test_get_ignored():
+    result_paths = {
+        Path("vcf/r1.vcf"),
+        Path("reviewer/r1.bam"),
+        Path("qc/reviewer/r1.QC"),
+        Path("r1.yaml"),
+    }
+
+    nbr_ignored, non_ignored = get_ignored(result_paths, ["reviewer"])
+
+    assert sorted(non_ignored) == [Path("r1.yaml"), Path("vcf/r1.vcf")]
+    assert dict(nbr_ignored) == {"reviewer": 1, "qc/reviewer": 1}
+
+    # Ignore entries are single folder names, so a slash never matches
+    nbr_ignored, non_ignored = get_ignored(result_paths, ["qc/reviewer"])
+    assert len(non_ignored) == 4
+    assert dict(nbr_ignored) == {}
+    assert not any_is_parent(Path("qc/reviewer/r1.QC"), ["qc/reviewer"])
+    assert any_is_parent(Path("qc/reviewer/r1.QC"), ["reviewer"])
+    assert not any_is_parent(Path("qc/old_reviewer/r1.QC"), ["reviewer"])
+
+
+def test_get_files_in_dir(tmp_path: Path):
+    results = tmp_path / "results"
+    (results / "vcf").mkdir(parents=True)
+    (results / "vcf" / "r1.vcf").write_text("")
+    (results / "r1.yaml").write_text("")
+    (results / "linked.yaml").symlink_to(results / "r1.yaml")
+    (results / "linked_dir").symlink_to(results / "vcf")
+
+    paths = get_files_in_dir(results, "r1", "RUNID", results)
+
+    relative_paths = sorted(str(path) for path in paths)
+    assert relative_paths == ["RUNID.yaml", "linked.yaml", "vcf/RUNID.vcf"]
+
+    threaded_paths = get_files_in_dir(results, "r1", "RUNID", results, threads=4)
+    assert sorted(str(path) for path in threaded_paths) == relative_paths
+
+
+def test_run_object_lists_without_threads(tmp_path: Path, monkeypatch):
+    for run_id in ["r1", "r2"]:
+        (tmp_path / run_id / "vcf").mkdir(parents=True)
+        (tmp_path / run_id / "vcf" / f"{run_id}.vcf").write_text("")
+
+    def no_threads(*args, **kwargs):
+        raise AssertionError("No threads should be started by default")
+
+    monkeypatch.setattr(run_object, "ThreadPoolExecutor", no_threads)
+    ro = RunObject("r1", "r2", tmp_path / "r1", tmp_path / "r2")
+
+    assert [str(path) for path in ro.r1_paths] == ["vcf/RUNID.vcf"]
+    assert [str(path) for path in ro.r2_paths] == ["vcf/RUNID.vcf"]
+
+
+def make_run_object(tmp_path: Path, names: List[str]) -> RunObject:
+    """Both runs get the same files, with RUNID replaced by the run ID"""
+    for run_id in ["r1", "r2"]:
+        for name in names:
+            path = tmp_path / run_id / name.replace("RUNID", run_id)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+    return RunObject("r1", "r2", tmp_path / "r1", tmp_path / "r2")
+
+
+def test_get_pair_match_pattern_priority(tmp_path: Path):
+    ro = make_run_object(
+        tmp_path, ["RUNID.scored.vcf.gz", "RUNID.snv.rescored.sorted.vcf.gz"]
+    )
+    logger = logging.getLogger(__name__)
+
+    patterns = ["RUNID.snv.rescored.sorted.vcf.gz$", "RUNID.scored.vcf.gz$"]
+    index_patterns(ro, patterns + ["vcf.gz$"])
+    pair = get_pair_match(logger, "snv_vcf", patterns, ro, False)
+    assert pair is not None
+    assert pair[0].name == "r1.snv.rescored.sorted.vcf.gz"
+    assert pair[1].name == "r2.snv.rescored.sorted.vcf.gz"
+
+    with pytest.raises(ValueError):
+        get_pair_match(logger, "snv_vcf", ["vcf.gz$"], ro, False)
+
+
+def test_get_pair_match_uncombinable_patterns(tmp_path: Path):
+    ro = make_run_object(tmp_path, ["qc/RUNID.QC", "vcf/RUNID.vcf"])
+    logger = logging.getLogger(__name__)
+
+    # Inline global flags must start the expression
+    flag_patterns = ["(?i)qc/runid.qc$", "other$"]
+    # Group names cannot be repeated within one expression
+    group_patterns = [r"(?P<s>vcf)/RUNID\.vcf$", r"(?P<s>qc)/RUNID\.QC$"]
+    index_patterns(ro, flag_patterns + group_patterns)
+
+    pair = get_pair_match(logger, "qc", flag_patterns, ro, False)
+    assert pair is not None
+    assert pair[0].name == "r1.QC"
+
+    pair = get_pair_match(logger, "vcf", group_patterns, ro, False)
+    assert pair is not None
+    assert pair[0].name == "r1.vcf"
+
+
+def test_get_literal_pattern():
+    assert get_literal_pattern(r"qc/RUNID\.QC$") == ("qc/RUNID.QC", True)
+    assert get_literal_pattern("reviewer") == ("reviewer", False)
+    assert get_literal_pattern("qc/RUNID.QC$") is None
+    assert get_literal_pattern(r"call_variants/\w+.vcf.gz$") is None
+    assert get_literal_pattern("RUNID\\$") is None
+
+
+def test_trim_wildcards():
+    assert trim_wildcards(".*vcf/RUNID.vcf.gz.*") == "vcf/RUNID.vcf.gz"
+    assert trim_wildcards("qc/.*$") == "qc/"
+    assert trim_wildcards(".*?RUNID") == ".*?RUNID"
+    assert trim_wildcards(r"RUNID\.*") == r"RUNID\.*"
+
+
+def test_get_literal_suffix():
+    assert get_literal_suffix("vcf/RUNID.vcf.gz$") == "gz"
+    assert get_literal_suffix(r"qc/RUNID\.QC$") == "qc/RUNID.QC"
+    assert get_literal_suffix(r"(\w+)\.bam$") == ".bam"
+    assert get_literal_suffix("RUNID.bam?$") == ""
+    assert get_literal_suffix("RUNID.bam$|RUNID.cram$") == ""
+    assert get_literal_suffix("RUNID.bam") == ""
+    assert get_literal_suffix(r"RUNID\.Q\101$") == ""
+    assert get_literal_suffix(r"QC\x41$") == ""
+    assert get_literal_suffix(r"QC\u0041$") == ""
+    assert get_literal_suffix(r"QC\N{LATIN CAPITAL LETTER A}$") == ""
+    assert get_literal_suffix(r"QC\wbam$") == "bam"
+
+
+def test_detect_run_id():
+    logger = logging.getLogger(__name__)
+    assert detect_run_id(logger, "241111-1033_wgs-run", False) == "wgs-run"
+    assert detect_run_id(logger, "wgs-run", False) == "wgs-run"
+    assert detect_run_id(logger, "241111-103_wgs-run", False) == "241111-103_wgs-run"
+
+
+def test_get_pair_match_cached(tmp_path: Path):
+    for run_id in ["r1", "r2"]:
+        (tmp_path / run_id).mkdir()
+        (tmp_path / run_id / f"{run_id}.yaml").write_text("")
+    ro = RunObject("r1", "r2", tmp_path / "r1", tmp_path / "r2")
+    logger = logging.getLogger(__name__)
+
+    pair = get_pair_match(logger, "yaml", ["RUNID.yaml$"], ro, False)
+    assert pair == (tmp_path / "r1" / "r1.yaml", tmp_path / "r2" / "r2.yaml")
+    assert list(ro.pair_match_cache) == [("RUNID.yaml$",)]
+    assert [str(path) for path in ro.r1_index["RUNID.yaml$"]] == ["RUNID.yaml"]
+
+    assert get_pair_match(logger, "yaml", ["RUNID.yaml$"], ro, False) == pair
@@ -0,0 +1,18 @@
+import logging
+from pathlib import Path
+
+from commands.run.file_helpers import replace_link
+
+LOG = logging.getLogger()
+
+
+def test_replace_link(tmp_path: Path):
+    link = tmp_path / "nextflow.log"
+
+    replace_link(LOG, str(link), str(tmp_path / "missing.log"))
+    assert link.is_symlink()
+    assert not link.exists()
+
+    # Links with missing targets are replaced as well
+    replace_link(LOG, str(link), str(tmp_path / "run.log"))
+    assert link.resolve() == (tmp_path / "run.log").resolve()
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from shared.util import read_config
+
+
+def test_read_config(tmp_path: Path):
+    config_path = tmp_path / "config.ini"
+    config_path.write_text("[section]\nkey = value\n")
+
+    config = read_config(config_path)
+    assert config["section"]["key"] == "value"
+    assert read_config(config_path) is config
+
+    # Changed files are parsed again
+    config_path.write_text("[section]\nkey = new value\n")
+    assert read_config(config_path)["section"]["key"] == "new value"
+
+    assert read_config(tmp_path / "missing.ini").sections() == []
+
+    # Values are not interpolated
+    config_path.write_text("[section]\nkey = 50%\n")
+    assert read_config(config_path)["section"]["key"] == "50%"